@@ -8,6 +8,7 @@ overhead that previously cost ~190 s per task.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import threading
@@ -39,7 +40,10 @@ def kill_all_containers():
             log.warning("Failed to remove container %s: %s", cid, e)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_docker_client():
+    """Shared Docker client. Cached per process so ``code_execute`` does not
+    re-read the environment and open a new connection pool on every call."""
     import docker
     return docker.from_env()
 
@@ -206,13 +210,16 @@ def create_docker_tools(db: ResearchDB) -> list:
             f"{language} /workspace/output/{script_name}")
         shell_cmd = " && ".join(cmd_parts)
 
+        def _run(volumes, research_id):
+            # Container lookup/creation talks to the Docker daemon too; keep it
+            # in the same worker-thread hop as the exec, off the event loop.
+            container = session.get_or_create(client, volumes, research_id)
+            return _exec_in_container(container, shell_cmd,
+                                      settings.docker_sandbox_timeout)
+
         try:
-            container = session.get_or_create(
-                client, _build_volumes(), db.research_id,
-            )
             stdout, stderr, exit_code, timed_out = await asyncio.to_thread(
-                _exec_in_container, container, shell_cmd,
-                settings.docker_sandbox_timeout,
+                _run, _build_volumes(), db.research_id,
             )
         except Exception as e:
             return json.dumps({"error": f"Container execution failed: {e}"})
@@ -9,15 +9,46 @@ import contextvars
 from pathlib import Path
 from datetime import datetime
 import json
+import logging
 import re
+import shutil
 import threading
 import time
 
+from backend.utils import encode_json
+
+log = logging.getLogger(__name__)
+
 _current_task_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "current_task_id", default=None,
 )
 
 
+# Session files served directly by the session routes
+_PLAN_TREE_FILE = "plan_tree.json"
+_PLAN_LIST_FILE = "plan_list.json"
+_META_FILE = "meta.json"
+
+# Session outputs owned by each stage, removed by clear_stage_outputs()
+_STAGE_OUTPUT_DIRS = {
+    "refine": ("proposals", "critiques"),
+    "research": ("tasks", "evaluations", "strategy", "artifacts", "reproduce"),
+    "write": ("drafts", "reviews"),
+}
+_STAGE_OUTPUT_FILES = {
+    "refine": ("refined_idea.md",),
+    "research": (
+        "calibration.md", _PLAN_TREE_FILE, _PLAN_LIST_FILE,
+        "results_summary.json", "results_summary.md", "execution_log.jsonl",
+    ),
+    "write": ("paper.md", "paper_polished.md"),
+}
+
+
+def _task_output_subpath(task_id: str) -> str:
+    return f"tasks/{task_id.replace('/', '_')}.md"
+
+
 def _read(path: Path) -> str:
     try:
         return path.read_text(encoding="utf-8")
@@ -35,12 +66,18 @@ def _read_json(path: Path, default=None):
         return default if default is not None else {}
 
 
-def _write_json(path: Path, data):
+def _write_text(path: Path, text: str):
+    """Write *text* by atomic replace: readers never see a partial file, and
+    every rewrite gets a new inode for the session routes' body cache."""
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp.write_text(text, encoding="utf-8")
     tmp.replace(path)
 
 
+def _write_json(path: Path, data):
+    _write_text(path, json.dumps(data, indent=2, ensure_ascii=False))
+
+
 class ResearchDB:
     """Manages a research session's file storage."""
 
@@ -50,6 +87,10 @@ class ResearchDB:
         self.research_id: str = ""
         self._meta_lock = threading.Lock()
         self._log_lock = threading.Lock()
+        self._log_io_lock = threading.Lock()
+        self._log_pending: list[str] = []
+        self._log_wakeup = threading.Event()
+        self._log_writer: threading.Thread | None = None
         self._exec_log_lock = threading.Lock()
 
     @property
@@ -61,6 +102,7 @@ class ResearchDB:
         _current_task_id_var.set(value)
 
     def create_session(self, idea: str = "") -> str:
+        self.flush_log()
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         slug = re.sub(r"[^a-z0-9\s]", "", idea.lower().strip()).split()[:5]
         slug_str = "-".join(slug) if slug else ""
@@ -74,6 +116,7 @@ class ResearchDB:
         root = self._base / research_id
         if not root.exists() or not root.is_dir():
             raise RuntimeError(f"Research session '{research_id}' not found.")
+        self.flush_log()
         self.research_id = research_id
         self._root = root
 
@@ -100,7 +143,7 @@ class ResearchDB:
         self._ensure_root()
         path = self._root / subpath
         path.parent.mkdir(exist_ok=True)
-        path.write_text(text, encoding="utf-8")
+        _write_text(path, text)
 
     def _save_json(self, subpath: str, data):
         self._ensure_root()
@@ -117,9 +160,13 @@ class ResearchDB:
         self._save_text("refined_idea.md", text)
 
     def save_plan(self, tree: dict, flat_tasks: list[dict] | None = None):
-        self._save_json("plan_tree.json", tree)
+        self._save_json(_PLAN_TREE_FILE, tree)
         if flat_tasks is not None:
-            self._save_json("plan_list.json", flat_tasks)
+            self.save_plan_list(flat_tasks)
+
+    def save_plan_list(self, flat_tasks: list[dict]):
+        """Save only the flat task list (status/batch changes leave the tree as-is)."""
+        self._save_json(_PLAN_LIST_FILE, flat_tasks)
 
     def save_paper(self, text: str):
         self._save_text("paper.md", text)
@@ -128,8 +175,7 @@ class ResearchDB:
         self._save_text("paper_polished.md", text)
 
     def save_task_output(self, task_id: str, text: str):
-        safe_id = task_id.replace("/", "_")
-        self._save_text(f"tasks/{safe_id}.md", text)
+        self._save_text(_task_output_subpath(task_id), text)
 
     def save_calibration(self, text: str):
         self._save_text("calibration.md", text)
@@ -140,9 +186,9 @@ class ResearchDB:
     def save_score_direction(self, minimize: bool):
         self._ensure_root()
         with self._meta_lock:
-            meta = _read_json(self._root / "meta.json")
+            meta = _read_json(self._root / _META_FILE)
             meta["score_direction"] = "minimize" if minimize else "maximize"
-            _write_json(self._root / "meta.json", meta)
+            _write_json(self._root / _META_FILE, meta)
 
     def save_evaluation(self, data: dict, iteration: int):
         self._save_json(f"evaluations/round_{iteration}.json", data)
@@ -191,9 +237,39 @@ class ResearchDB:
             entry["task_id"] = task_id
         if label:
             entry["label"] = True
+        line = encode_json(entry) + "\n"
+        with self._log_lock:
+            self._log_pending.append(line)
+            if self._log_writer is None:
+                self._log_writer = threading.Thread(
+                    target=self._log_writer_loop, name="research-log-writer", daemon=True,
+                )
+                self._log_writer.start()
+        self._log_wakeup.set()
+
+    def _log_writer_loop(self):
+        """Background writer: chunks queued while a write is in flight go out together."""
+        while True:
+            self._log_wakeup.wait()
+            self._log_wakeup.clear()
+            try:
+                self.flush_log()
+            except OSError as e:
+                log.warning("Failed to write log.jsonl: %s", e)
+
+    def flush_log(self):
+        """Write queued log chunks to the current session's log.jsonl."""
+        with self._log_io_lock:
+            self._flush_log_locked()
+
+    def _flush_log_locked(self):
+        # Caller holds _log_io_lock.
+        # append_log only queues entries once a session root exists.
         with self._log_lock:
+            pending, self._log_pending = self._log_pending, []
+        if pending:
             with open(self._root / "log.jsonl", "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.write("".join(pending))
 
     def append_execution_log(self, task_id: str, script: str,
                              language: str = "python", requirements: str = ""):
@@ -208,9 +284,9 @@ class ResearchDB:
     def update_meta(self, **kwargs):
         self._ensure_root()
         with self._meta_lock:
-            meta = _read_json(self._root / "meta.json")
+            meta = _read_json(self._root / _META_FILE)
             meta.update(kwargs)
-            _write_json(self._root / "meta.json", meta)
+            _write_json(self._root / _META_FILE, meta)
 
     # --- Read ---
 
@@ -241,17 +317,18 @@ class ResearchDB:
         return [f"{prefix}/{f.stem}" for f in sorted(subdir.glob("round_*.md"))]
 
     def get_plan_list(self) -> list[dict]:
-        return self._get_json("plan_list.json", default=[])
+        return self._get_json(_PLAN_LIST_FILE, default=[])
 
     def get_plan_tree(self) -> dict:
-        return self._get_json("plan_tree.json", default={})
+        return self._get_json(_PLAN_TREE_FILE, default={})
 
     def get_log(self, offset: int = 0, stage: str = "") -> tuple[list[dict], int]:
         self._ensure_root()
         path = self._root / "log.jsonl"
-        if not path.exists():
-            return [], 0
-        with self._log_lock:
+        with self._log_io_lock:
+            self._flush_log_locked()
+            if not path.exists():
+                return [], 0
             lines = path.read_text(encoding="utf-8").splitlines()
         entries = []
         new_offset = offset
@@ -283,14 +360,13 @@ class ResearchDB:
         return entries
 
     def get_meta(self) -> dict:
-        return self._get_json("meta.json")
+        return self._get_json(_META_FILE)
 
     def get_document(self, name: str) -> str:
-        return self._get_text(f"{name}.md")
+        return _read(self.document_path(name))
 
     def get_task_output(self, task_id: str) -> str:
-        safe_id = task_id.replace("/", "_")
-        return self._get_text(f"tasks/{safe_id}.md")
+        return _read(self.task_output_path(task_id))
 
     def get_results_summary(self) -> str:
         data = self._get_json("results_summary.json", default={})
@@ -300,7 +376,7 @@ class ResearchDB:
         return self._get_json("results_summary.json", default={})
 
     def get_score_minimize(self) -> bool:
-        return self._get_json("meta.json").get("score_direction", "minimize") == "minimize"
+        return self._get_json(_META_FILE).get("score_direction", "minimize") == "minimize"
 
     def get_strategy_for(self, iteration: int) -> str:
         return self._get_text(f"strategy/round_{iteration}.md")
@@ -332,6 +408,26 @@ class ResearchDB:
                 results.append(data)
         return results
 
+    def plan_tree_path(self) -> Path:
+        self._ensure_root()
+        return self._root / _PLAN_TREE_FILE
+
+    def plan_list_path(self) -> Path:
+        self._ensure_root()
+        return self._root / _PLAN_LIST_FILE
+
+    def meta_path(self) -> Path:
+        self._ensure_root()
+        return self._root / _META_FILE
+
+    def document_path(self, name: str) -> Path:
+        self._ensure_root()
+        return self._root / f"{name}.md"
+
+    def task_output_path(self, task_id: str) -> Path:
+        self._ensure_root()
+        return self._root / _task_output_subpath(task_id)
+
     def get_tasks_dir(self) -> Path:
         self._ensure_root()
         return self._root / "tasks"
@@ -370,44 +466,32 @@ class ResearchDB:
         self._save_json(f"{dirname}/round_{iteration}.json", data)
 
     def clear_stage_outputs(self, stage_name: str):
-        import shutil
         self._ensure_root()
-        stage_dirs = {
-            "refine": ("proposals", "critiques"),
-            "research": ("tasks", "evaluations", "strategy", "artifacts", "reproduce"),
-            "write": ("drafts", "reviews"),
-        }
-        stage_files = {
-            "refine": ("refined_idea.md",),
-            "research": (
-                "calibration.md", "plan_tree.json", "plan_list.json",
-                "results_summary.json", "results_summary.md", "execution_log.jsonl",
-            ),
-            "write": ("paper.md", "paper_polished.md"),
-        }
-        for dirname in stage_dirs.get(stage_name, ()):
+        for dirname in _STAGE_OUTPUT_DIRS.get(stage_name, ()):
             path = self._root / dirname
             if path.exists():
                 shutil.rmtree(path)
-        for filename in stage_files.get(stage_name, ()):
+        for filename in _STAGE_OUTPUT_FILES.get(stage_name, ()):
             path = self._root / filename
             if path.exists():
                 path.unlink()
         # Clear stage-specific log entries
         log_path = self._root / "log.jsonl"
-        if log_path.exists():
-            kept_lines = []
-            for line in log_path.read_text(encoding="utf-8").splitlines():
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
+        with self._log_io_lock:
+            self._flush_log_locked()
+            if log_path.exists():
+                kept_lines = []
+                for line in log_path.read_text(encoding="utf-8").splitlines():
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        kept_lines.append(line)
+                        continue
+                    if entry.get("stage") == stage_name:
+                        continue
                     kept_lines.append(line)
-                    continue
-                if entry.get("stage") == stage_name:
-                    continue
-                kept_lines.append(line)
-            text = ("\n".join(kept_lines) + "\n") if kept_lines else ""
-            log_path.write_text(text, encoding="utf-8")
+                text = ("\n".join(kept_lines) + "\n") if kept_lines else ""
+                log_path.write_text(text, encoding="utf-8")
 
     def promote_best_score(self):
         if not self.current_task_id:
@@ -1,16 +1,15 @@
 import socket
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 
 # Agno calls search tools (wikipedia, arxiv) synchronously with no timeout.
 # A hanging HTTP request blocks the entire event loop. Global socket timeout
 # ensures all network calls fail after 30s rather than hanging forever.
 socket.setdefaulttimeout(20)
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
 
 from backend.config import settings
 from backend.pipeline.orchestrator import PipelineOrchestrator
@@ -49,18 +48,64 @@ async def lifespan(app):
     await orchestrator.shutdown()
 
 
-class NoCacheStaticMiddleware(BaseHTTPMiddleware):
-    """Disable caching for JS/CSS so dev changes take effect immediately."""
-    async def dispatch(self, request: Request, call_next):
-        response: Response = await call_next(request)
-        path = request.url.path
-        if path.endswith(('.js', '.css')):
-            response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-        return response
+class NoCacheStaticMiddleware:
+    """Disable caching for JS/CSS so dev changes take effect immediately.
+
+    Plain ASGI middleware: API and SSE requests pass straight through without
+    the task group BaseHTTPMiddleware wraps around every request.
+    """
+    _SUFFIXES = (".js", ".css")
+    _HEADER = (b"cache-control", b"no-cache, no-store, must-revalidate")
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].endswith(self._SUFFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_no_cache(message):
+            if message["type"] == "http.response.start":
+                headers = [h for h in message.get("headers", []) if h[0].lower() != b"cache-control"]
+                headers.append(self._HEADER)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_no_cache)
+
+
+class CompressedResponseMiddleware:
+    """Gzip large responses (plan trees, documents, logs).
+
+    Older Starlette releases buffer event streams inside the gzip encoder,
+    which would hold SSE frames back, so the event stream bypasses it.
+    Artifacts (PNGs, zips, pickled models) are mostly compressed already
+    and are served untouched as well.
+    """
+    _SKIP_PREFIXES = ("/api/events", "/api/session/artifacts/")
+
+    def __init__(self, app, minimum_size: int = 1024, compresslevel: int = 4):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self._SKIP_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await self.gzip(scope, receive, send)
 
 
 app = FastAPI(title="MAARS", version="0.1.0", lifespan=lifespan)
 app.add_middleware(NoCacheStaticMiddleware)
+app.add_middleware(CompressedResponseMiddleware)
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception(request: Request, exc: Exception):
+    """Report unexpected route errors as a 500 in FastAPI's usual ``detail`` shape."""
+    return JSONResponse(status_code=500, content={"detail": str(exc)})
+
 
 app.include_router(pipeline_routes.router)
 app.include_router(event_routes.router)
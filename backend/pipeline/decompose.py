@@ -13,13 +13,61 @@ from backend.utils import parse_json_fenced
 from backend.pipeline.prompts import build_decompose_system, build_decompose_user
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: str
     description: str
     dependencies: list[str] = field(default_factory=list)
     is_atomic: bool | None = None
     children: list[str] = field(default_factory=list)
+    parent: str | None = None  # recorded at creation; IDs are not re-parsed
+    depth: int = 0
+
+
+class _CoalescedProgress:
+    """Report the tree to *on_judge_done* at most once per interval, reusing unchanged subtrees."""
+
+    INTERVAL = 0.2  # seconds
+
+    def __init__(self, on_judge_done: Callable | None, tasks: dict[str, Task], root_id: str):
+        self._callback = on_judge_done
+        self._tasks = tasks
+        self._root_id = root_id
+        self._handle: asyncio.TimerHandle | None = None
+        self._cache: dict[str, dict] = {}
+        self._dirty: set[str] = set()
+
+    def mark(self, task_id: str):
+        # Dirty the task and its ancestors; stop early at an already-dirty one
+        tid = task_id
+        while tid is not None and tid not in self._dirty:
+            self._dirty.add(tid)
+            task = self._tasks.get(tid)
+            tid = task.parent if task else None
+        if self._callback is None or self._handle is not None:
+            return
+        self._handle = asyncio.get_running_loop().call_later(self.INTERVAL, self.flush)
+
+    def tree(self) -> dict:
+        tree = _serialize_tree(self._tasks, self._root_id, self._cache, self._dirty)
+        self._dirty.clear()
+        return tree
+
+    def flush(self):
+        if self._handle is None:
+            return
+        self._handle.cancel()
+        self._handle = None
+        try:
+            self._callback(self.tree())
+        except Exception:
+            # Progress is best-effort; a failed save must not abort decomposition
+            log.warning("Decompose progress report failed", exc_info=True)
+
+    def cancel(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
 
 
 async def decompose(
@@ -35,7 +83,6 @@ async def decompose(
     root_id: str = "0",
 ) -> tuple[list[dict], dict]:
     system_prompt = build_decompose_system(atomic_definition, strategy)
-    progress_fn = on_judge_done or (lambda tree: None)
     stale = is_stale or (lambda: False)
     ctx = context or idea
 
@@ -45,25 +92,33 @@ async def decompose(
     root = Task(id=root_id, description=idea)
     tasks[root_id] = root
     pending.append(root_id)
-
-    while pending:
-        if stale():
-            break
-        batch = list(pending)
-        pending.clear()
-        results = await asyncio.gather(*[
-            _process_task(tid, tasks, pending, ctx, system_prompt,
-                          max_depth, stream_fn, progress_fn, stale,
-                          root_id, root_siblings)
-            for tid in batch
-        ], return_exceptions=True)
-        for tid, result in zip(batch, results):
-            if isinstance(result, Exception):
-                log.warning("Decompose judge %s failed: %s", tid, result)
-                tasks[tid].is_atomic = True  # degrade: treat as atomic
-
-    tree = _serialize_tree(tasks, root_id)
-    flat_tasks = _finalize(tasks, root_id)
+    progress = _CoalescedProgress(on_judge_done, tasks, root_id)
+
+    try:
+        while pending:
+            if stale():
+                break
+            batch = list(pending)
+            pending.clear()
+            results = await asyncio.gather(*[
+                _process_task(tid, tasks, pending, ctx, system_prompt,
+                              max_depth, stream_fn, progress.mark, stale,
+                              root_id, root_siblings)
+                for tid in batch
+            ], return_exceptions=True)
+            for tid, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    log.warning("Decompose judge %s failed: %s", tid, result)
+                    tasks[tid].is_atomic = True  # degrade: treat as atomic
+                    progress.mark(tid)
+        progress.flush()
+    finally:
+        progress.cancel()
+
+    tree = progress.tree()
+    # Every judge has finished, so nothing mutates *tasks* while the
+    # dependency resolution runs off the event loop.
+    flat_tasks = await asyncio.to_thread(_finalize, tasks, root_id)
     return flat_tasks, tree
 
 
@@ -71,10 +126,9 @@ async def _process_task(task_id, tasks, pending, context, system_prompt,
                         max_depth, stream_fn, progress_fn, stale,
                         root_id="0", root_siblings=None):
     task = tasks[task_id]
-    depth = _depth(task_id, root_id)
-    if depth >= max_depth:
+    if task.depth >= max_depth:
         task.is_atomic = True
-        progress_fn(_serialize_tree(tasks, root_id))
+        progress_fn(task_id)
         return
 
     is_root = task_id == root_id
@@ -102,13 +156,13 @@ async def _process_task(task_id, tasks, pending, context, system_prompt,
 
     if data.get("is_atomic", True):
         task.is_atomic = True
-        progress_fn(_serialize_tree(tasks, root_id))
+        progress_fn(task_id)
         return
 
     subtasks = data.get("subtasks", [])
     if not subtasks or not all("id" in st and "description" in st for st in subtasks):
         task.is_atomic = True
-        progress_fn(_serialize_tree(tasks, root_id))
+        progress_fn(task_id)
         return
 
     seen_ids = set()
@@ -116,7 +170,7 @@ async def _process_task(task_id, tasks, pending, context, system_prompt,
         if st["id"] in seen_ids:
             log.warning("Judge %s: duplicate subtask id '%s', treating as atomic", task_id, st["id"])
             task.is_atomic = True
-            progress_fn(_serialize_tree(tasks, root_id))
+            progress_fn(task_id)
             return
         seen_ids.add(st["id"])
 
@@ -127,34 +181,20 @@ async def _process_task(task_id, tasks, pending, context, system_prompt,
             d if is_root and root_id == "0" else f"{task_id}_{d}"
             for d in st.get("dependencies", [])
         ]
-        child = Task(id=child_id, description=st["description"], dependencies=child_deps)
+        child = Task(id=child_id, description=st["description"], dependencies=child_deps,
+                     parent=task_id, depth=task.depth + 1)
         tasks[child_id] = child
         task.children.append(child_id)
         pending.append(child_id)
 
-    progress_fn(_serialize_tree(tasks, root_id))
-
-
-def _depth(task_id: str, root_id: str) -> int:
-    """Compute depth relative to root."""
-    if task_id == root_id:
-        return 0
-    if root_id == "0":
-        return len(task_id.split("_"))
-    # Verify task_id is actually a descendant (must start with root_id + "_")
-    prefix = root_id + "_"
-    if not task_id.startswith(prefix):
-        return 0
-    return len(task_id[len(root_id):].split("_")) - 1
+    progress_fn(task_id)
 
 
 def _get_siblings(task_id: str, tasks: dict[str, Task], root_id: str = "0") -> list[dict]:
     """Return sibling tasks (same parent, excluding self)."""
     if task_id == root_id:
         return []
-    parts = task_id.rsplit("_", 1)
-    parent_id = parts[0] if len(parts) > 1 else root_id
-    parent = tasks.get(parent_id)
+    parent = tasks.get(tasks[task_id].parent)
     if not parent:
         return []
     return [
@@ -166,73 +206,100 @@ def _get_siblings(task_id: str, tasks: dict[str, Task], root_id: str = "0") -> l
 
 def _finalize(tasks, root_id="0"):
     atomic_tasks = {tid: t for tid, t in tasks.items() if t.is_atomic}
-    resolved = _resolve_dependencies(tasks, atomic_tasks, root_id)
+    resolved = _resolve_dependencies(tasks, atomic_tasks)
     return [
         {"id": tid, "description": atomic_tasks[tid].description, "dependencies": deps}
         for tid, deps in resolved.items()
     ]
 
 
-def _serialize_tree(tasks, root_id="0"):
+def _serialize_tree(tasks, root_id="0", cache=None, dirty=None):
+    """Build the nested tree dict.
+
+    With *cache* and *dirty*, nodes not in *dirty* are reused from *cache*
+    (callers must dirty a task's ancestors along with it); rebuilt nodes are
+    stored back into *cache*.
+    """
     def build_node(task_id):
+        if cache is not None and task_id not in dirty and task_id in cache:
+            return cache[task_id]
         task = tasks.get(task_id)
         if not task:
             return None
-        return {
+        node = {
             "id": task.id, "description": task.description,
             "dependencies": task.dependencies, "is_atomic": task.is_atomic,
             "children": [build_node(cid) for cid in task.children],
         }
+        if cache is not None:
+            cache[task_id] = node
+        return node
     return build_node(root_id) or {}
 
 
-def _resolve_dependencies(all_tasks, atomic_tasks, root_id="0"):
+def _resolve_dependencies(all_tasks, atomic_tasks):
     resolved = {}
+    inherited: dict[str, frozenset] = {}
+    descendants: dict[str, frozenset] = {}
     for tid in atomic_tasks:
-        collected = set()
-        for ancestor_id in _ancestor_chain(tid, root_id):
-            ancestor = all_tasks.get(ancestor_id)
-            if ancestor:
-                collected.update(ancestor.dependencies)
-        collected.update(all_tasks[tid].dependencies)
         expanded = set()
-        for dep_id in collected:
+        for dep_id in _inherited_dependencies(all_tasks, tid, inherited):
             if dep_id in atomic_tasks:
                 expanded.add(dep_id)
             else:
-                expanded.update(_get_atomic_descendants(all_tasks, dep_id, atomic_tasks))
+                expanded.update(_atomic_descendants(all_tasks, dep_id, atomic_tasks, descendants))
         expanded.discard(tid)
         resolved[tid] = sorted(expanded)
     return resolved
 
 
-def _ancestor_chain(task_id, root_id="0"):
-    parts = task_id.split("_")
-    ancestors = []
-    for i in range(len(parts) - 1, 0, -1):
-        candidate = "_".join(parts[:i])
-        ancestors.append(candidate)
-        if candidate == root_id:
+def _inherited_dependencies(all_tasks, task_id, memo):
+    """Dependencies declared by *task_id* or any of its ancestors.
+
+    Results are memoized per node in *memo*, so siblings share their
+    parent's set and each ancestor chain is walked once per plan rather
+    than once per atomic task.
+    """
+    chain = []
+    tid = task_id
+    while tid is not None and tid not in memo:
+        task = all_tasks.get(tid)
+        if task is None:
             break
-    else:
-        if root_id not in ancestors:
-            ancestors.append(root_id)
-    return ancestors
-
-
-def _get_atomic_descendants(all_tasks, task_id, atomic_tasks, _visited=None):
-    if _visited is None:
-        _visited = set()
-    if task_id in _visited:
-        return set()
-    _visited.add(task_id)
-    result = set()
-    task = all_tasks.get(task_id)
-    if not task:
-        return result
-    if task_id in atomic_tasks:
-        result.add(task_id)
-        return result
-    for child_id in task.children:
-        result.update(_get_atomic_descendants(all_tasks, child_id, atomic_tasks, _visited))
-    return result
+        chain.append(task)
+        tid = task.parent
+    acc = memo.get(tid, frozenset())
+    for task in reversed(chain):
+        if task.dependencies:
+            acc = acc.union(task.dependencies)
+        memo[task.id] = acc
+    return acc
+
+
+def _atomic_descendants(all_tasks, task_id, atomic_tasks, memo):
+    """Atomic tasks in the subtree rooted at *task_id*.
+
+    Walks the subtree iteratively (post-order) and memoizes every node in
+    *memo*, so a subtree named as a dependency by many atomic tasks is
+    expanded once per plan. A node met again while its own subtree is
+    still open contributes nothing, as before.
+    """
+    stack = [(task_id, False)]
+    open_nodes: set[str] = set()
+    while stack:
+        tid, expanded = stack.pop()
+        if tid in memo:
+            continue
+        task = all_tasks.get(tid)
+        if task is None:
+            memo[tid] = frozenset()
+        elif tid in atomic_tasks:
+            memo[tid] = frozenset((tid,))
+        elif expanded:
+            open_nodes.discard(tid)
+            memo[tid] = frozenset().union(*(memo.get(cid, ()) for cid in task.children))
+        elif tid not in open_nodes:
+            open_nodes.add(tid)
+            stack.append((tid, True))
+            stack.extend((cid, False) for cid in task.children)
+    return memo.get(task_id, frozenset())
@@ -3,6 +3,7 @@ import logging
 
 from backend.db import ResearchDB
 from backend.pipeline.stage import Stage, StageState
+from backend.utils import encode_json
 
 STAGE_ORDER = ["refine", "research", "write"]
 
@@ -23,6 +24,7 @@ class PipelineOrchestrator:
         self._api_semaphore = asyncio.Semaphore(settings.api_concurrency)
 
     def subscribe(self) -> asyncio.Queue:
+        """Return a queue of SSE frames, serialized once by ``_broadcast``."""
         q: asyncio.Queue = asyncio.Queue(maxsize=1024)
         self._subscribers.add(q)
         return q
@@ -47,23 +49,32 @@ class PipelineOrchestrator:
                 self._reset_stages()
                 self._pipeline_task = asyncio.create_task(self._run_from("refine"))
 
-    async def stop(self):
+    async def stop(self) -> str:
+        """Pause the running stage; return its name, or "" if none was running."""
+        # Lock-free fast path for the idle case; rechecked under the lock
+        if not self._find_stage(StageState.RUNNING):
+            return ""
         async with self._lock:
             stage = self._find_stage(StageState.RUNNING)
             if not stage:
-                return
+                return ""
             stage.request_stop()
             self._kill_containers()
             await self._cancel_pipeline(timeout=5.0)
             stage.pause()
+            return stage.name
 
-    async def resume(self):
+    async def resume(self) -> str:
+        """Resume the paused stage; return its name, or "" if none was paused."""
+        if not self._find_stage(StageState.PAUSED):
+            return ""
         async with self._lock:
             stage = self._find_stage(StageState.PAUSED)
             if not stage:
-                return
+                return ""
             stage.prepare_resume()
             self._pipeline_task = asyncio.create_task(self._run_from(stage.name))
+            return stage.name
 
     async def run_stage(self, stage_name: str, session_id: str | None = None,
                         clear_outputs: bool = True):
@@ -99,6 +110,12 @@ class PipelineOrchestrator:
     async def shutdown(self):
         self._kill_containers()
         await self._cancel_pipeline(timeout=5.0)
+        # Cancelled stages log on teardown; the background log writer is a
+        # daemon thread, so write out whatever is still queued now.
+        try:
+            self.db.flush_log()
+        except OSError:
+            logging.getLogger(__name__).warning("Failed to flush log on shutdown", exc_info=True)
 
     def _find_stage(self, state: StageState) -> Stage | None:
         for name in STAGE_ORDER:
@@ -179,9 +196,13 @@ class PipelineOrchestrator:
         self._kill_containers()
 
     def _broadcast(self, event: dict):
+        if not self._subscribers:
+            return
+        # Serialize once; every subscriber queue gets the same SSE frame
+        frame = f"data: {encode_json(event)}\n\n"
         for q in list(self._subscribers):
             try:
-                q.put_nowait(event)
+                q.put_nowait(frame)
             except asyncio.QueueFull:
                 logging.getLogger(__name__).warning(
                     "SSE queue full, dropping event for stage=%s", event.get("stage")
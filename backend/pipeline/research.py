@@ -24,23 +24,81 @@ from backend.utils import parse_json_fenced
 
 def topological_batches(tasks: list[dict], precompleted: set[str] | None = None) -> list[list[dict]]:
     task_map = {t["id"]: t for t in tasks}
-    remaining = set(task_map.keys())
-    completed: set[str] = set(precompleted or set())
+    completed: set[str] = set(precompleted or ())
+    # Count unsatisfied deps per task and decrement as deps complete, instead
+    # of rescanning every remaining task's dependency list for each batch.
+    # Deps that are neither precompleted nor in the plan are never satisfied.
+    unsatisfied: dict[str, int] = {}
+    dependents: dict[str, list[str]] = {}
+    for tid, task in task_map.items():
+        count = 0
+        for d in task.get("dependencies", ()):
+            if d not in completed:
+                count += 1
+                dependents.setdefault(d, []).append(tid)
+        unsatisfied[tid] = count
+    remaining = dict.fromkeys(task_map)
+    ready = [tid for tid in remaining if unsatisfied[tid] == 0]
     batches: list[list[dict]] = []
     while remaining:
-        batch_ids = [
-            tid for tid in remaining
-            if all(d in completed for d in task_map[tid].get("dependencies", []))
-        ]
-        if not batch_ids:
-            log.warning("Dependency cycle detected among tasks %s — forcing execution", remaining)
-            batch_ids = list(remaining)
+        if not ready:
+            dropped = _break_cycles(remaining, task_map, completed, unsatisfied)
+            log.warning("Dependency cycle detected among tasks %s — dropping edges %s",
+                        set(remaining), dropped)
+            ready = [tid for tid in remaining if unsatisfied[tid] == 0]
+        batch_ids = ready
         batches.append([task_map[tid] for tid in batch_ids])
-        completed.update(batch_ids)
-        remaining -= set(batch_ids)
+        ready = []
+        for tid in batch_ids:
+            del remaining[tid]
+        for tid in batch_ids:
+            for dependent in dependents.get(tid, ()):
+                unsatisfied[dependent] -= 1
+                if unsatisfied[dependent] == 0 and dependent in remaining:
+                    ready.append(dependent)
     return batches
 
 
+def _break_cycles(remaining: dict, task_map: dict[str, dict], completed: set[str],
+                  unsatisfied: dict[str, int]) -> list[tuple[str, str]]:
+    """Drop the dependency edges that block *remaining* tasks from ever running.
+
+    One iterative DFS over the dependency graph (white/gray/black colouring)
+    finds back edges — edges into a task still on the DFS stack — in
+    O(V + E), without enumerating individual cycles. Dependencies on tasks
+    that are neither in the plan nor completed can never be satisfied and
+    are dropped as well.
+    Updates *unsatisfied* in place and returns the dropped (task, dep) pairs.
+    """
+    color = dict.fromkeys(remaining, 0)  # 0 = white, 1 = gray, 2 = black
+    dropped: list[tuple[str, str]] = []
+    for start in remaining:
+        if color[start]:
+            continue
+        color[start] = 1
+        stack = [(start, iter(task_map[start].get("dependencies", ())))]
+        while stack:
+            tid, deps = stack[-1]
+            for d in deps:
+                if d in completed:
+                    continue
+                state = color.get(d)
+                if state is None and d in task_map:
+                    continue  # already batched
+                if state is None or state == 1:
+                    # Unknown dep, or back edge closing a cycle
+                    dropped.append((tid, d))
+                    unsatisfied[tid] -= 1
+                elif state == 0:
+                    color[d] = 1
+                    stack.append((d, iter(task_map[d].get("dependencies", ()))))
+                    break
+            else:
+                color[tid] = 2
+                stack.pop()
+    return dropped
+
+
 def _preflight_docker():
     try:
         import docker
@@ -55,14 +113,15 @@ def _preflight_docker():
         )
 
 
-def _find_node(tree: dict, node_id: str) -> dict | None:
-    if tree.get("id") == node_id:
-        return tree
-    for child in tree.get("children", []):
-        found = _find_node(child, node_id)
-        if found:
-            return found
-    return None
+def _find_node(tree: dict, node_id: str) -> tuple[dict | None, dict | None]:
+    """Return ``(node, parent)`` for *node_id* in one walk; parent is None at the root."""
+    stack: list[tuple[dict, dict | None]] = [(tree, None)]
+    while stack:
+        node, parent = stack.pop()
+        if node.get("id") == node_id:
+            return node, parent
+        stack.extend((child, node) for child in node.get("children", []))
+    return None, None
 
 
 # Pre-installed packages in Docker sandbox — keep in sync with Dockerfile.sandbox
@@ -94,10 +153,10 @@ class ResearchStage(Stage):
         self._prev_score: float | None = None
         self._partial_outputs: dict[str, str] = {}
         self._current_task_id: str | None = None
+        self._capability_profile: str = ""
+        self._task_pos: dict[str, int] = {}
 
     def _llm(self, instruction, user_text, call_id, content_level=2, timeout=None, **kwargs):
-        if timeout is None:
-            timeout = settings.agent_session_timeout_seconds()
         task_id = kwargs.pop("task_id", None) or self._current_task_id or ""
         skip_sem = kwargs.pop("_skip_semaphore", False)
         tools = kwargs.pop("tools", self._tools)
@@ -107,8 +166,19 @@ class ResearchStage(Stage):
             _skip_semaphore=skip_sem, **kwargs,
         )
 
+    def _decompose_llm(self, instruction, user_text, call_id, content_level, **kwargs):
+        """stream_fn for decompose(): judges default to the decompose toolset."""
+        kwargs.setdefault("tools", self._decompose_tools)
+        return self._llm(instruction, user_text, call_id, content_level=content_level, **kwargs)
+
     def _build_capability_profile(self) -> str:
-        """Deterministic capability profile built from config + tools."""
+        """Deterministic capability profile built from config + tools.
+
+        Settings and tools are fixed for the stage's lifetime, so the profile
+        is rendered once and reused by Calibrate, Strategy and Evaluate.
+        """
+        if self._capability_profile:
+            return self._capability_profile
         _code_exec_desc = (
             "Execute Python in Docker sandbox. Returns stdout, stderr, exit_code, generated file list. "
             "stdout truncated to 5000 chars."
@@ -156,7 +226,8 @@ class ResearchStage(Stage):
             name = getattr(t, '__name__', None) or getattr(t, 'name', type(t).__name__)
             desc = _TOOL_DESCS.get(name, getattr(t, '__doc__', '') or '')
             lines.append(f"- **{name}**: {desc}" if desc else f"- {name}")
-        return "\n".join(lines)
+        self._capability_profile = "\n".join(lines)
+        return self._capability_profile
 
     def _describe_dataset(self) -> str:
         """Describe dataset files if available."""
@@ -186,6 +257,9 @@ class ResearchStage(Stage):
 
     async def _execute(self) -> str:
         await asyncio.to_thread(_preflight_docker)
+        # The first profile build may probe the GPU via nvidia-smi or a docker
+        # run (seconds); warm the cache off the event loop.
+        await asyncio.to_thread(self._build_capability_profile)
 
         self.output = ""
         idea = self.db.get_refined_idea()
@@ -195,7 +269,8 @@ class ResearchStage(Stage):
 
         if self.state == StageState.FAILED:
             raise RuntimeError("Research stage failed: one or more tasks could not be completed")
-        return self._build_final_output()
+        # Summary and reproduce files walk every artifact; keep SSE responsive
+        return await asyncio.to_thread(self._build_final_output)
 
     # ------------------------------------------------------------------
     # Calibrate (one-time)
@@ -337,9 +412,7 @@ class ResearchStage(Stage):
 
         flat_tasks, tree = await decompose(
             idea=idea,
-            stream_fn=lambda inst, ut, cid, cl, **kw: self._llm(
-                inst, ut, cid, content_level=cl,
-                tools=kw.pop("tools", self._decompose_tools), **kw),
+            stream_fn=self._decompose_llm,
             max_depth=10,
             atomic_definition=self._atomic_definition,
             strategy=self._strategy,
@@ -348,7 +421,9 @@ class ResearchStage(Stage):
         )
         self._all_tasks = flat_tasks
         self._tree = tree
-        self._persist_plan()
+        # The final progress flush already wrote this tree; the full task
+        # list is written from a worker thread so SSE keeps flowing
+        await asyncio.to_thread(self._persist_plan, False)
 
     async def _decompose_round(self, idea: str, round_num: int):
         """Iteration decompose with enriched context."""
@@ -370,9 +445,7 @@ class ResearchStage(Stage):
 
         new_flat, subtree = await decompose(
             idea=f"Round {round_num}",
-            stream_fn=lambda inst, ut, cid, cl, **kw: self._llm(
-                inst, ut, cid, content_level=cl,
-                tools=kw.pop("tools", self._decompose_tools), **kw),
+            stream_fn=self._decompose_llm,
             max_depth=10,
             atomic_definition=self._atomic_definition,
             strategy=self._strategy,
@@ -386,32 +459,29 @@ class ResearchStage(Stage):
             return
 
         self._all_tasks.extend(new_flat)
-        self._persist_plan()
+        await asyncio.to_thread(self._persist_plan, False)  # subtree already saved by _on_done
 
         self._send()  # done: decompose round finished
 
     def _init_task_batches(self):
         """Recompute pending-task batches after completed work and persist them."""
         completed_ids = set(self._task_results.keys())
-        completed_batch_max = max(
-            (int(t.get("batch", 0) or 0) for t in self._all_tasks if t["id"] in completed_ids),
-            default=0,
-        )
-        pending_tasks = [t for t in self._all_tasks if t["id"] not in completed_ids]
+        completed_batch_max = 0
+        pending_tasks = []
+        for t in self._all_tasks:
+            if t["id"] in completed_ids:
+                completed_batch_max = max(completed_batch_max, int(t.get("batch", 0) or 0))
+            else:
+                pending_tasks.append(t)
+        if not pending_tasks:
+            return
+        # Batches hold the same dicts as _all_tasks, so update them in place
         batches = topological_batches(pending_tasks, precompleted=completed_ids)
-        updates = {}
-        for batch_idx, batch in enumerate(batches):
+        for batch_idx, batch in enumerate(batches, start=completed_batch_max + 1):
             for t in batch:
-                updates[t["id"]] = {
-                    "status": "pending",
-                    "batch": completed_batch_max + batch_idx + 1,
-                }
-        if updates:
-            for t in self._all_tasks:
-                fields = updates.get(t["id"])
-                if fields:
-                    t.update(fields)
-            self._persist_plan()
+                t["status"] = "pending"
+                t["batch"] = batch_idx
+        self._persist_plan(tree=False)
 
     # ------------------------------------------------------------------
     # Task execution
@@ -419,18 +489,16 @@ class ResearchStage(Stage):
 
     async def _execute_all_tasks(self) -> bool:
         while True:
-            batches = topological_batches(self._all_tasks)
+            # Batch only unfinished work; completed tasks just satisfy deps
+            completed_ids = set(self._task_results)
+            pending_tasks = [t for t in self._all_tasks if t["id"] not in completed_ids]
+            if not pending_tasks:
+                break
+            batches = topological_batches(pending_tasks, precompleted=completed_ids)
             had_redecompose = False
 
-            for batch in batches:
-                pending = [t for t in batch if t["id"] not in self._task_results]
-                if not pending:
-                    continue
-
-                results = await asyncio.gather(
-                    *[self._execute_task(task) for task in pending],
-                    return_exceptions=True,
-                )
+            for pending in batches:
+                results = await self._run_batch(pending)
 
                 for task, result in zip(pending, results):
                     if isinstance(result, Exception):
@@ -443,16 +511,8 @@ class ResearchStage(Stage):
                     if needs_redecompose:
                         new_tasks = await self._redecompose_task(task, exec_result, review)
                         if new_tasks:
-                            parent_id = task["id"]
-                            subtask_ids = [t["id"] for t in new_tasks]
-                            self._all_tasks = [t for t in self._all_tasks if t["id"] != parent_id]
-                            self._all_tasks.extend(new_tasks)
-                            for t in self._all_tasks:
-                                if parent_id in t.get("dependencies", []):
-                                    t["dependencies"] = [
-                                        d for d in t["dependencies"] if d != parent_id
-                                    ] + subtask_ids
-                            self._persist_plan()
+                            self._splice_subtasks(task["id"], new_tasks)
+                            self._persist_plan(tree=False)  # tree saved during redecompose
                             had_redecompose = True
                         else:
                             self._update_task(task["id"], status="failed")
@@ -466,8 +526,50 @@ class ResearchStage(Stage):
             if not had_redecompose:
                 break
 
+        # Prior attempts only seed subtasks of redecomposed parents; once every
+        # task has run they would just pin full LLM outputs for the session.
+        self._partial_outputs.clear()
         return False
 
+    async def _run_batch(self, batch: list[dict]) -> list:
+        """Execute *batch* on a fixed pool of workers, results in batch order.
+
+        Tasks beyond the API concurrency would only queue on the semaphore,
+        so at most that many workers pull from a shared iterator instead of
+        one coroutine per task. Exceptions are returned, not raised.
+        """
+        results: list = [None] * len(batch)
+        queue = iter(enumerate(batch))
+
+        async def worker():
+            for idx, task in queue:
+                try:
+                    results[idx] = await self._execute_task(task)
+                except Exception as e:
+                    results[idx] = e
+
+        workers = max(1, min(len(batch), settings.api_concurrency))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results
+
+    def _splice_subtasks(self, parent_id: str, new_tasks: list[dict]):
+        """Replace *parent_id* in _all_tasks with its subtasks in one pass.
+
+        Dependents of the parent are rewired to depend on every subtask while
+        the plan is rebuilt, rather than filtering and rescanning it again.
+        """
+        subtask_ids = [t["id"] for t in new_tasks]
+        spliced = []
+        for t in self._all_tasks:
+            if t["id"] == parent_id:
+                continue
+            deps = t.get("dependencies")
+            if deps and parent_id in deps:
+                t["dependencies"] = [d for d in deps if d != parent_id] + subtask_ids
+            spliced.append(t)
+        spliced.extend(new_tasks)
+        self._all_tasks = spliced
+
     async def _execute_task(self, task: dict) -> tuple[bool, dict, str, str]:
         task_id = task["id"]
         # Derive parent from ID; _partial_outputs only has entries for redecomposed parents
@@ -495,6 +597,8 @@ class ResearchStage(Stage):
         }
         instruction, user_text = build_execute_prompt(task, prior_attempt, dep_summaries)
         result = await self._llm(instruction, user_text, call_id, content_level=4, label=True, label_level=3, _skip_semaphore=True)
+        # The execute prompt is not reused; don't pin it across verify/retry
+        del instruction, user_text
         self._update_summary(task_id, result)
 
         passed, review, redecompose = await self._verify_task(task, result, task_id, call_id)
@@ -686,19 +790,9 @@ class ResearchStage(Stage):
     # Redecompose
     # ------------------------------------------------------------------
 
-    def _get_task_siblings(self, task_id: str) -> list[dict]:
-        """Get sibling tasks from the decomposition tree."""
-        if not self._tree:
-            return []
-        def find_parent(node, target_id):
-            for child in node.get("children", []):
-                if child.get("id") == target_id:
-                    return node
-                found = find_parent(child, target_id)
-                if found:
-                    return found
-            return None
-        parent = find_parent(self._tree, task_id)
+    @staticmethod
+    def _get_task_siblings(parent: dict | None, task_id: str) -> list[dict]:
+        """Get sibling tasks of *task_id* under its decomposition-tree parent."""
         if not parent:
             return []
         return [
@@ -727,9 +821,11 @@ class ResearchStage(Stage):
                 f"Do not redo parts that are already adequate — focus on what is missing."
             )
 
+        # Locate the node once; judge callbacks update it in place
+        node, parent = _find_node(self._tree, task_id) if self._tree else (None, None)
+
         def _on_done(tree):
             if self._tree:
-                node = _find_node(self._tree, task_id)
                 if node:
                     node.update(tree)
                 self.db.save_plan(self._tree)
@@ -740,16 +836,14 @@ class ResearchStage(Stage):
 
         flat_tasks, subtree = await decompose(
             idea=enriched_desc,
-            stream_fn=lambda inst, ut, cid, cl, **kw: self._llm(
-                inst, ut, cid, content_level=cl,
-                tools=kw.pop("tools", self._decompose_tools), **kw),
+            stream_fn=self._decompose_llm,
             max_depth=10,
             atomic_definition=self._atomic_definition,
             strategy=self._strategy,
             on_judge_done=_on_done,
             is_stale=lambda: False,
             context=self.db.get_refined_idea(),
-            root_siblings=self._get_task_siblings(task_id),
+            root_siblings=self._get_task_siblings(parent, task_id),
             root_id=task_id,
         )
         if not flat_tasks:
@@ -786,24 +880,47 @@ class ResearchStage(Stage):
     # Plan persistence — _all_tasks is the in-memory source of truth
     # ------------------------------------------------------------------
 
-    def _persist_plan(self):
-        """Write current in-memory plan (tree + task list) to disk."""
-        if self.db:
+    def _persist_plan(self, tree: bool = True):
+        """Write current in-memory plan (tree + task list) to disk.
+
+        Pass ``tree=False`` when only task fields changed, so the unchanged
+        decomposition tree is not re-serialized.
+        """
+        if not self.db:
+            return
+        if tree:
             self.db.save_plan(self._tree or {}, self._all_tasks)
+        else:
+            self.db.save_plan_list(self._all_tasks)
+
+    def _find_task(self, task_id: str) -> dict | None:
+        """Look up a task in _all_tasks via a cached id → position index.
+
+        _all_tasks is reassigned and spliced in several places, so a hit is
+        validated against the current list and the index rebuilt when stale.
+        """
+        tasks = self._all_tasks
+        pos = self._task_pos.get(task_id)
+        if pos is None or pos >= len(tasks) or tasks[pos]["id"] != task_id:
+            self._task_pos = {t["id"]: i for i, t in enumerate(tasks)}
+            pos = self._task_pos.get(task_id)
+            if pos is None:
+                return None
+        return tasks[pos]
 
     def _update_task(self, task_id: str, **fields):
         """Update a task's fields in _all_tasks and sync to disk."""
-        for t in self._all_tasks:
-            if t["id"] == task_id:
-                t.update(fields)
-                break
-        self._persist_plan()
+        task = self._find_task(task_id)
+        if task is not None:
+            task.update(fields)
+        self._persist_plan(tree=False)
 
     def retry(self):
         super().retry()
         self._task_results.clear()
         self._task_summaries.clear()
         self._all_tasks.clear()
+        self._task_pos.clear()
         self._tree = None
         self._strategy = ""
         self._prev_score = None
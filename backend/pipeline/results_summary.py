@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import stat
 from pathlib import Path
 
 from backend.db import ResearchDB
@@ -21,13 +22,18 @@ def build_results_summary(db: ResearchDB) -> tuple[dict, str]:
 def _collect_artifact_manifest(root: Path) -> list[dict]:
     if not root.exists():
         return []
-    return [
-        {
-            "path": str(fp.relative_to(root)).replace("\\", "/"),
-            "size_bytes": fp.stat().st_size,
-        }
-        for fp in sorted(p for p in root.rglob("*") if p.is_file())
-    ]
+    manifest = []
+    for fp in sorted(root.rglob("*")):
+        try:
+            st = fp.stat()  # one stat serves both the file check and the size
+        except OSError:
+            continue  # e.g. dangling symlink, which is_file() also skipped
+        if stat.S_ISREG(st.st_mode):
+            manifest.append({
+                "path": str(fp.relative_to(root)).replace("\\", "/"),
+                "size_bytes": st.st_size,
+            })
+    return manifest
 
 
 def _score_snapshot(path: Path) -> dict | None:
@@ -56,11 +62,10 @@ def _build_data(db: ResearchDB) -> dict:
             continue
         task_id = task["id"]
         task_artifacts_root = db.get_artifacts_dir(task_id)
-        task_artifacts = []
-        for fi in _collect_artifact_manifest(task_artifacts_root):
-            fi = dict(fi)
+        # Manifest entries are freshly built, so re-prefix them in place
+        task_artifacts = _collect_artifact_manifest(task_artifacts_root)
+        for fi in task_artifacts:
             fi["path"] = f"artifacts/{task_id}/{fi['path']}"
-            task_artifacts.append(fi)
         completed_tasks.append({
             "id": task_id,
             "description": task.get("description", ""),
@@ -72,17 +77,13 @@ def _build_data(db: ResearchDB) -> dict:
             "best_score": _score_snapshot(task_artifacts_root / "best_score.json"),
         })
 
-    artifact_manifest = []
-    for fi in _collect_artifact_manifest(artifacts_root):
-        fi = dict(fi)
-        fi["path"] = f"artifacts/{fi['path']}"
-        artifact_manifest.append(fi)
-
     figure_suffixes = {".png", ".jpg", ".jpeg", ".svg", ".pdf"}
-    figures = [
-        a for a in artifact_manifest
-        if Path(a["path"]).suffix.lower() in figure_suffixes
-    ]
+    artifact_manifest = _collect_artifact_manifest(artifacts_root)
+    figures = []
+    for fi in artifact_manifest:
+        fi["path"] = f"artifacts/{fi['path']}"
+        if Path(fi["path"]).suffix.lower() in figure_suffixes:
+            figures.append(fi)
 
     evaluation_rounds = []
     for idx, ev in enumerate(evaluations, start=0):
@@ -6,6 +6,7 @@ import asyncio
 import contextlib
 import logging
 import time
+from copy import deepcopy
 from enum import Enum
 
 from agno.agent import Agent, RunEvent
@@ -13,6 +14,20 @@ from backend.config import settings
 
 log = logging.getLogger(__name__)
 
+# Settings are loaded once at import; resolve the values read on every LLM
+# call here instead of re-deriving them per call.
+_RATE_INTERVAL: float = float(settings.api_request_interval)
+_AGENT_TIMEOUT: float = float(settings.agent_session_timeout_seconds())
+
+# Plain-string event kinds: comparing against RunEvent members goes through
+# Enum attribute lookup and Enum.__eq__ for every streamed event.
+_EV_CONTENT = RunEvent.run_content.value
+_EV_REASONING = RunEvent.reasoning_step.value
+_EV_TOOL_STARTED = RunEvent.tool_call_started.value
+_EV_TOOL_COMPLETED = RunEvent.tool_call_completed.value
+_EV_ERROR = RunEvent.run_error.value
+_EV_COMPLETED = RunEvent.run_completed.value
+
 
 class StageState(str, Enum):
     IDLE = "idle"
@@ -32,8 +47,7 @@ class Stage:
     """
 
     # Class-level rate limiter: ensures minimum gap between consecutive LLM calls
-    _rate_gate: asyncio.Lock | None = None
-    _rate_last_ts: float = 0
+    _rate_last_ts: float = 0  # start time reserved by the latest LLM call
 
     def __init__(self, name: str, db=None, broadcast=None):
         self.name = name
@@ -125,17 +139,19 @@ class Stage:
     # ------------------------------------------------------------------
 
     async def _rate_limit(self):
-        """Ensure minimum gap between consecutive LLM calls (class-wide)."""
-        interval = settings.api_request_interval
+        """Ensure minimum gap between consecutive LLM calls (class-wide).
+
+        Each caller reserves the next free start time and sleeps until it.
+        The reservation has no await in it, so no lock is needed.
+        """
+        interval = _RATE_INTERVAL
         if interval <= 0:
             return
-        if Stage._rate_gate is None:
-            Stage._rate_gate = asyncio.Lock()
-        async with Stage._rate_gate:
-            wait = Stage._rate_last_ts + interval - time.monotonic()
-            if wait > 0:
-                await asyncio.sleep(wait)
-            Stage._rate_last_ts = time.monotonic()
+        now = time.monotonic()
+        slot = max(now, Stage._rate_last_ts + interval)
+        Stage._rate_last_ts = slot
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
     async def _stream_llm(self, model, tools, instruction: str, user_text: str,
                           call_id: str, content_level: int = 2,
@@ -143,7 +159,7 @@ class Stage:
                           label: bool = False, label_level: int | None = None,
                           task_id: str = "", _skip_semaphore: bool = False) -> str:
         if timeout is None:
-            timeout = float(settings.agent_session_timeout_seconds())
+            timeout = _AGENT_TIMEOUT
         extra = {"task_id": task_id} if task_id else {}
         await self._rate_limit()
         sem = contextlib.nullcontext() if (_skip_semaphore or not self._api_semaphore) else self._api_semaphore
@@ -179,30 +195,32 @@ class Stage:
 
     async def _run_agent(self, model, tools, instruction, user_text,
                          call_id, content_level, timeout, extra) -> str:
-        from copy import deepcopy
         result = ""
         agent = Agent(model=deepcopy(model), instructions=instruction, tools=tools, markdown=True)
+        # Bound once per call rather than re-resolved for every streamed event
+        handle_event = self._handle_stream_event
         async with asyncio.timeout(timeout):
             async for event in agent.arun(user_text, stream=True, stream_events=True):
                 if self._stop_requested:
                     raise asyncio.CancelledError()
-                content = self._handle_stream_event(event, call_id, content_level, extra)
+                content = handle_event(event, call_id, content_level, extra)
                 if content:
                     result += content
         return result
 
     def _handle_stream_event(self, event, call_id, content_level, extra) -> str | None:
-        if event.event == RunEvent.run_content:
+        kind = event.event
+        if kind == _EV_CONTENT:
             if event.content:
                 text = str(event.content)
                 self._send(chunk={"text": text, "call_id": call_id, "level": content_level}, **extra)
                 return text
-        elif event.event == RunEvent.reasoning_step:
+        elif kind == _EV_REASONING:
             if event.content:
                 rid = event.call_id or "Thinking"
                 self._send(chunk={"text": rid, "call_id": rid, "label": True, "level": content_level}, **extra)
                 self._send(chunk={"text": str(event.content), "call_id": rid, "level": content_level}, **extra)
-        elif event.event == RunEvent.tool_call_started:
+        elif kind == _EV_TOOL_STARTED:
             tool_name = event.tool.tool_name if event.tool else "tool"
             tcid = getattr(event.tool, "tool_call_id", "") or f"{tool_name}_{id(event.tool)}" if event.tool else tool_name
             tool_cid = f"Tool: {tcid}"
@@ -210,17 +228,17 @@ class Stage:
             if event.tool and event.tool.tool_args:
                 args_str = ", ".join(f"{k}={v}" for k, v in event.tool.tool_args.items())
                 self._send(chunk={"text": f"{tool_name}({args_str})", "call_id": tool_cid, "level": content_level}, **extra)
-        elif event.event == RunEvent.tool_call_completed:
+        elif kind == _EV_TOOL_COMPLETED:
             tool_name = event.tool.tool_name if event.tool else "tool"
             tcid = getattr(event.tool, "tool_call_id", "") or f"{tool_name}_{id(event.tool)}" if event.tool else tool_name
             cid = f"Tool: {tcid}"
             result_text = str(event.content)[:500] if event.content else ""
             if result_text:
                 self._send(chunk={"text": result_text, "call_id": cid, "level": content_level}, **extra)
-        elif event.event == RunEvent.run_error:
+        elif kind == _EV_ERROR:
             error_msg = str(event.content) if event.content else "Unknown agent error"
             raise RuntimeError(f"Agno agent error: {error_msg}")
-        elif event.event == RunEvent.run_completed:
+        elif kind == _EV_COMPLETED:
             self._record_metrics(event.metrics)
         return None
 
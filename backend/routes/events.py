@@ -1,11 +1,51 @@
 import asyncio
-import json
 
 from fastapi import APIRouter, Request
 from starlette.responses import StreamingResponse
 
 router = APIRouter(prefix="/api")
 
+# Flush a coalesced write once it grows past this many bytes, even if more
+# events are already queued behind it.
+SSE_BATCH_BYTES = 4096
+# When a write already coalesces a backlog, wait this long for more to
+# arrive: a burst of streamed tokens then goes out as one write. A lone
+# frame (a state change, a done signal) is sent without waiting.
+SSE_BATCH_WINDOW = 0.015  # seconds
+
+
+def _drain_batch(first: str, queue: asyncio.Queue, limit: int = SSE_BATCH_BYTES) -> str:
+    """Coalesce *first* plus any already-queued frames into one SSE write.
+
+    Streaming LLM output produces many tiny chunks; when the client falls
+    behind they pile up in the subscriber queue. Draining what is ready
+    turns that backlog into a few large writes instead of one frame per
+    token, without delaying events when the queue is empty. Frames arrive
+    already serialized by the orchestrator, once for all subscribers.
+    """
+    frames = [first]
+    size = len(first)
+    while size < limit:
+        try:
+            frame = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        frames.append(frame)
+        size += len(frame)
+    return "".join(frames)
+
+
+async def _collect_batch(first: str, queue: asyncio.Queue,
+                         window: float = SSE_BATCH_WINDOW,
+                         limit: int = SSE_BATCH_BYTES) -> str:
+    """Drain ready frames; if that found a backlog, give stragglers *window* seconds to join."""
+    text = _drain_batch(first, queue, limit)
+    if window > 0 and len(first) < len(text) < limit:
+        await asyncio.sleep(window)
+        if not queue.empty():
+            text += _drain_batch(queue.get_nowait(), queue, limit - len(text))
+    return text
+
 
 @router.get("/events")
 async def event_stream(request: Request):
@@ -21,9 +61,8 @@ async def event_stream(request: Request):
                 if await request.is_disconnected():
                     break
                 try:
-                    event = await asyncio.wait_for(queue.get(), timeout=15.0)
-                    payload = json.dumps(event, ensure_ascii=False)
-                    yield f"data: {payload}\n\n"
+                    frame = await asyncio.wait_for(queue.get(), timeout=15.0)
+                    yield await _collect_batch(frame, queue)
                 except asyncio.TimeoutError:
                     yield ": keepalive\n\n"
         except (asyncio.CancelledError, GeneratorExit):
@@ -4,7 +4,7 @@ from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Request
 
-from backend.models import StartRequest, StageRunRequest, ActionResponse, PipelineStatus, StageStatus
+from backend.models import StartRequest, StageRunRequest, ActionResponse, PipelineStatus
 
 router = APIRouter(prefix="/api")
 WORKSPACE_ROOT = Path(__file__).resolve().parents[2]
@@ -47,8 +47,6 @@ def _is_within_allowed_roots(candidate: Path, allowed_roots: tuple[Path, ...]) -
 
 
 def _resolve_research_input(raw_input: str) -> str:
-    from backend.kaggle import extract_competition_id
-
     text = raw_input.strip()
     if not text:
         raise HTTPException(status_code=400, detail="Input cannot be empty")
@@ -90,49 +88,39 @@ def _resolve_research_input(raw_input: str) -> str:
                 detail=f"Could not read input file '{candidate_text}'",
             ) from exc
 
-    if extract_competition_id(candidate_text):
-        return text
-
+    # Anything else (plain text or a Kaggle URL) is passed through as typed;
+    # the orchestrator detects Kaggle competitions itself.
     return text
 
 
 @router.post("/pipeline/start")
-async def start_pipeline(req: StartRequest, request: Request):
+async def start_pipeline(req: StartRequest, request: Request) -> dict:
     orch = _get_orchestrator(request)
     research_input = _resolve_research_input(req.input)
-    try:
-        await orch.start(research_input)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    await orch.start(research_input)
     return {"status": "started", "input": research_input}
 
 
 @router.post("/pipeline/run-stage", response_model=ActionResponse)
 async def run_stage(req: StageRunRequest, request: Request):
     orch = _get_orchestrator(request)
-    try:
-        await orch.run_stage(
-            stage_name=req.stage,
-            session_id=req.session_id,
-            clear_outputs=req.clear_outputs,
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    await orch.run_stage(
+        stage_name=req.stage,
+        session_id=req.session_id,
+        clear_outputs=req.clear_outputs,
+    )
     return ActionResponse(stage=req.stage, state="running", message="Stage started")
 
 
 @router.get("/pipeline/status", response_model=PipelineStatus)
 async def get_status(request: Request):
     orch = _get_orchestrator(request)
-    status = orch.get_status()
-    return PipelineStatus(
-        input=status["input"],
-        stages=[StageStatus(**s) for s in status["stages"]],
-    )
+    # response_model validates and serializes the dict in one pydantic-core pass
+    return orch.get_status()
 
 
 @router.get("/docker/status")
-async def docker_status():
+async def docker_status() -> dict:
     try:
         import docker
         def _ping():
@@ -147,18 +135,12 @@ async def docker_status():
 @router.post("/pipeline/stop", response_model=ActionResponse)
 async def stop_pipeline(request: Request):
     orch = _get_orchestrator(request)
-    await orch.stop()
-    from backend.pipeline.stage import StageState
-    running = next((n for n in ["refine", "research", "write"]
-                     if orch.stages[n].state == StageState.PAUSED), "")
-    return ActionResponse(stage=running, state="paused", message="Pipeline paused")
+    paused = await orch.stop()
+    return ActionResponse(stage=paused, state="paused", message="Pipeline paused")
 
 
 @router.post("/pipeline/resume", response_model=ActionResponse)
 async def resume_pipeline(request: Request):
     orch = _get_orchestrator(request)
-    await orch.resume()
-    from backend.pipeline.stage import StageState
-    resumed = next((n for n in ["refine", "research", "write"]
-                     if orch.stages[n].state == StageState.RUNNING), "")
+    resumed = await orch.resume()
     return ActionResponse(stage=resumed, state="running", message="Pipeline resumed")
@@ -1,9 +1,13 @@
 """Read-only API endpoints for session data."""
 
+import asyncio
+import json
+from collections import OrderedDict
 from pathlib import Path
+from typing import Callable
 
 from fastapi import APIRouter, HTTPException, Request, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 
 router = APIRouter(prefix="/api/session")
 
@@ -17,7 +21,62 @@ def _get_db(request: Request):
     return orch.db
 
 
-def _resolve_relative_path(base_dir: Path, relative_path: str) -> Path:
+# Session file response bodies, LRU-cached per path and keyed by (mtime_ns, size, inode)
+_body_cache: OrderedDict[Path, tuple[tuple[int, int, int], bytes | None]] = OrderedDict()
+_BODY_CACHE_MAX = 64
+
+
+def _cached_body(path: Path, render: Callable[[bytes], bytes | None] | None = None) -> bytes | None:
+    """Body for *path* (raw, or passed through *render*); None if missing, empty or rejected."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    hit = _body_cache.get(path)
+    if hit is not None and hit[0] == key:
+        _body_cache.move_to_end(path)
+        return hit[1]
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return None
+    if not raw:
+        return None
+    body = render(raw) if render else raw
+    _body_cache[path] = (key, body)
+    _body_cache.move_to_end(path)
+    if len(_body_cache) > _BODY_CACHE_MAX:
+        _body_cache.popitem(last=False)
+    return body
+
+
+def _valid_json(raw: bytes) -> bytes | None:
+    """*raw* unchanged if it parses as JSON, else None."""
+    try:
+        json.loads(raw)
+    except ValueError:
+        return None
+    return raw
+
+
+def _json_file_response(path: Path, default: bytes) -> Response:
+    return Response(_cached_body(path, _valid_json) or default, media_type="application/json")
+
+
+def _text_file_response(path: Path, key: str, value: str) -> Response | None:
+    """JSON ``{key: value, "content": <file text>}``, or None if the file is missing or empty."""
+    def render(raw: bytes) -> bytes:
+        # Same newline translation read_text() applies
+        text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        payload = {key: value, "content": text}
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    body = _cached_body(path, render)
+    return Response(body, media_type="application/json") if body else None
+
+
+def _resolve_relative_path(base_dir: Path, relative_path: str | Path) -> Path:
     candidate = (base_dir / relative_path).resolve()
     base_resolved = base_dir.resolve()
     try:
@@ -28,54 +87,56 @@ def _resolve_relative_path(base_dir: Path, relative_path: str) -> Path:
 
 
 @router.get("/log")
-async def get_log(request: Request, stage: str = Query(""), offset: int = Query(0, ge=0)):
+async def get_log(request: Request, stage: str = Query(""), offset: int = Query(0, ge=0)) -> dict:
     db = _get_db(request)
-    entries, new_offset = db.get_log(offset=offset, stage=stage)
+    # Reads and parses the whole log file; keep that off the event loop
+    entries, new_offset = await asyncio.to_thread(db.get_log, offset=offset, stage=stage)
     return {"entries": entries, "offset": new_offset}
 
 
 @router.get("/plan/tree")
-async def get_plan_tree(request: Request):
+async def get_plan_tree(request: Request) -> Response:
     db = _get_db(request)
-    return db.get_plan_tree()
+    return _json_file_response(db.plan_tree_path(), b"{}")
 
 
 @router.get("/plan/list")
-async def get_plan_list(request: Request):
+async def get_plan_list(request: Request) -> Response:
     db = _get_db(request)
-    return db.get_plan_list()
+    return _json_file_response(db.plan_list_path(), b"[]")
 
 
 @router.get("/meta")
-async def get_meta(request: Request):
+async def get_meta(request: Request) -> Response:
     db = _get_db(request)
-    return db.get_meta()
+    return _json_file_response(db.meta_path(), b"{}")
 
 
 @router.get("/documents/list/{prefix}")
-async def list_documents(prefix: str, request: Request):
+async def list_documents(prefix: str, request: Request) -> list[str]:
     db = _get_db(request)
     _resolve_relative_path(db.session_dir, prefix)
     return db.list_documents(prefix)
 
 
 @router.get("/tasks/{task_id}")
-async def get_task_output(task_id: str, request: Request):
+async def get_task_output(task_id: str, request: Request) -> Response:
     db = _get_db(request)
-    content = db.get_task_output(task_id)
-    if not content:
+    response = _text_file_response(db.task_output_path(task_id), "task_id", task_id)
+    if response is None:
         raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found")
-    return {"task_id": task_id, "content": content}
+    return response
 
 
 @router.get("/documents/{name:path}")
-async def get_document(name: str, request: Request):
+async def get_document(name: str, request: Request) -> Response:
     db = _get_db(request)
-    _resolve_relative_path(db.session_dir, f"{name}.md")
-    content = db.get_document(name)
-    if not content:
+    path = db.document_path(name)
+    _resolve_relative_path(db.session_dir, path)
+    response = _text_file_response(path, "name", name)
+    if response is None:
         raise HTTPException(status_code=404, detail=f"Document '{name}' not found")
-    return {"name": name, "content": content}
+    return response
 
 
 @router.get("/artifacts/{artifact_path:path}")
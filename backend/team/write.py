@@ -5,6 +5,10 @@ import re
 
 from backend.team.stage import TeamStage
 
+# Markdown links and src/href attributes pointing at artifacts/ or
+# ../artifacts/, rewritten in one pass to the destination's prefix.
+_ARTIFACT_LINK_RE = re.compile(r'(\]\(|src="|href=")(?:\.\./)?artifacts/')
+
 
 class WriteStage(TeamStage):
 
@@ -25,19 +29,8 @@ class WriteStage(TeamStage):
     def _rewrite_artifact_paths(text: str, prefix: str) -> str:
         if not text:
             return text
-        normalized_prefix = prefix.rstrip("/")
-        patterns = [
-            (r"\]\(\.\./artifacts/", f"]({normalized_prefix}/artifacts/"),
-            (r'\]\(artifacts/', f"]({normalized_prefix}/artifacts/"),
-            (r'src="\.\./artifacts/', f'src="{normalized_prefix}/artifacts/'),
-            (r'src="artifacts/', f'src="{normalized_prefix}/artifacts/'),
-            (r'href="\.\./artifacts/', f'href="{normalized_prefix}/artifacts/'),
-            (r'href="artifacts/', f'href="{normalized_prefix}/artifacts/'),
-        ]
-        rewritten = text
-        for pattern, replacement in patterns:
-            rewritten = re.sub(pattern, replacement, rewritten)
-        return rewritten
+        artifacts = f"{prefix.rstrip('/')}/artifacts/"
+        return _ARTIFACT_LINK_RE.sub(lambda m: m.group(1) + artifacts, text)
 
     def load_input(self) -> str:
         from backend.config import settings
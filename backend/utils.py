@@ -3,6 +3,14 @@
 import json
 import re
 
+# json.dumps builds a fresh JSONEncoder whenever an option is non-default;
+# per-event and per-chunk paths share this bound one instead.
+encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+_INVALID_ESCAPE_RE = re.compile(r'\\(?!["\\/bfnrtu])')
+_LATEX_ESCAPE_RE = re.compile(r'\\([bfnrt])([a-zA-Z])')
+
 
 def parse_json_fenced(text: str, fallback: dict | None = None) -> dict:
     """Extract a JSON object from LLM output that may be wrapped in markdown fences.
@@ -35,7 +43,7 @@ def parse_json_fenced(text: str, fallback: dict | None = None) -> dict:
 def _json_candidates(text: str):
     """Yield candidate JSON strings: raw text first, then fenced blocks."""
     yield text
-    for match in re.finditer(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL):
+    for match in _FENCED_JSON_RE.finditer(text):
         yield match.group(1).strip()
 
 
@@ -51,8 +59,8 @@ def _repair_json_escapes(text: str) -> str:
       2. \r, \n, \t, \b, \f followed by a letter → \\X (LaTeX like \rho, \nu)
     """
     # Step 1: fix clearly invalid escapes (\i, \l, \s, \p, etc.)
-    text = re.sub(r'\\(?!["\\/bfnrtu])', r'\\\\', text)
+    text = _INVALID_ESCAPE_RE.sub(r'\\\\', text)
     # Step 2: fix ambiguous escapes that are LaTeX, not JSON
     # e.g. \rho (not carriage-return + "ho"), \beta, \nu, \tau, \frac
-    text = re.sub(r'\\([bfnrt])([a-zA-Z])', r'\\\\\1\2', text)
+    text = _LATEX_ESCAPE_RE.sub(r'\\\\\1\2', text)
     return text
@@ -84,9 +84,8 @@ export function initProcessViewer() {
     if (status && task_id) { updateTaskStatus(task_id, status); return; }
     if (chunk) return;
 
-    await handleDoneSignal(stage, phase, task_id);
-
-    const meta = await fetchMeta();
+    // Independent requests: refresh the panel and the token badge together
+    const [, meta] = await Promise.all([handleDoneSignal(stage, phase, task_id), fetchMeta()]);
     if (meta && tokenBadge) {
       const total = meta.tokens_total || 0;
       if (total > 0) {
@@ -197,13 +196,15 @@ async function handleDoneSignal(stage, phase, taskId) {
 async function loadDocCards(prefix, container) {
   const versions = await listDocuments(prefix);
   if (versions.length > 0) {
-    for (const docName of versions) {
-      const doc = await fetchDocument(docName);
+    // Fetch all rounds at once; cards are still added in round order
+    const docs = await Promise.all(versions.map((docName) => fetchDocument(docName)));
+    versions.forEach((docName, i) => {
+      const doc = docs[i];
       if (doc && doc.content) {
         documentCache[docName] = doc.content;
         ensureDocCard(docName, container);
       }
-    }
+    });
   } else {
     const doc = await fetchDocument(prefix);
     if (doc && doc.content) {
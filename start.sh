@@ -505,9 +505,21 @@ else
 fi
 
 ACTIVE_LABEL="Server"
-append_log "Starting uvicorn on port $SERVER_PORT"
+# uvicorn[standard] ships uvloop everywhere except Windows, and httptools on
+# every platform; ask for them explicitly so the SSE fan-out runs on libuv
+# and requests are parsed in C instead of by the pure-Python h11 fallback.
+UVICORN_LOOP=asyncio
+if [ "$OS_KIND" != windowsish ] && "$PYTHON" -c "import uvloop" >/dev/null 2>&1; then
+    UVICORN_LOOP=uvloop
+fi
+UVICORN_HTTP=h11
+if "$PYTHON" -c "import httptools" >/dev/null 2>&1; then
+    UVICORN_HTTP=httptools
+fi
+append_log "Starting uvicorn on port $SERVER_PORT (loop: $UVICORN_LOOP, http: $UVICORN_HTTP)"
 "$PYTHON" -m uvicorn backend.main:app \
     --reload --reload-include "*.py" --reload-dir backend \
+    --loop "$UVICORN_LOOP" --http "$UVICORN_HTTP" \
     --host 0.0.0.0 --port "$SERVER_PORT" \
     --timeout-graceful-shutdown 3 \
     --log-level warning >>"$LOG_FILE" 2>&1 &
@@ -0,0 +1,21 @@
+import asyncio
+
+
+def run_middleware(middleware, path, response_headers, body=b"", request_headers=()):
+    """Run *middleware* around a stub app that returns *body*; return the response headers."""
+    sent = []
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": list(response_headers)})
+        await send({"type": "http.response.body", "body": body})
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request"}
+
+    scope = {"type": "http", "path": path, "headers": list(request_headers)}
+    asyncio.run(middleware(app)(scope, receive, send))
+    return dict(sent[0]["headers"])
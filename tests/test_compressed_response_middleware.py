@@ -0,0 +1,30 @@
+import unittest
+
+from asgi_harness import run_middleware
+from backend.main import CompressedResponseMiddleware
+
+
+def _run(path):
+    return run_middleware(
+        CompressedResponseMiddleware, path,
+        [(b"content-type", b"application/json")], body=b"x" * 4096,
+        request_headers=[(b"accept-encoding", b"gzip")],
+    )
+
+
+class CompressedResponseMiddlewareTests(unittest.TestCase):
+    def test_large_api_responses_are_gzipped(self):
+        headers = _run("/api/session/plan")
+        self.assertEqual(headers.get(b"content-encoding"), b"gzip")
+
+    def test_event_stream_is_not_compressed(self):
+        headers = _run("/api/events")
+        self.assertNotIn(b"content-encoding", headers)
+
+    def test_artifacts_are_not_compressed(self):
+        headers = _run("/api/session/artifacts/4/model.pkl")
+        self.assertNotIn(b"content-encoding", headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
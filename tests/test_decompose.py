@@ -0,0 +1,156 @@
+import json
+import unittest
+
+from backend.pipeline.decompose import Task, _atomic_descendants, _inherited_dependencies, decompose
+
+
+def _scripted_judge(responses, calls: list | None = None):
+    """stream_fn stub: answer each 'Judge <id>' call from *responses*.
+
+    *responses* is a dict of task id → reply (default atomic) or a callable
+    taking the task id. Call ids are appended to *calls* when given.
+    """
+    async def stream_fn(system_prompt, user_text, call_id, content_level, **kwargs):
+        if calls is not None:
+            calls.append(call_id)
+        task_id = call_id.removeprefix("Judge ")
+        if callable(responses):
+            return json.dumps(responses(task_id))
+        return json.dumps(responses.get(task_id, {"is_atomic": True}))
+    return stream_fn
+
+
+def _task_map(*specs):
+    """Build a {id: Task} map from (id, parent, dependencies, is_atomic) tuples.
+
+    Parents must be listed before their children; each child is appended to
+    its parent's children and gets depth = parent depth + 1.
+    """
+    tasks = {}
+    for tid, parent, deps, is_atomic in specs:
+        node = Task(id=tid, description=tid, dependencies=list(deps),
+                    is_atomic=is_atomic, parent=parent)
+        if parent in tasks:
+            node.depth = tasks[parent].depth + 1
+            tasks[parent].children.append(tid)
+        tasks[tid] = node
+    return tasks
+
+
+class DecomposeTests(unittest.IsolatedAsyncioTestCase):
+    async def test_ancestor_dependencies_expand_to_atomic_descendants(self):
+        judge = _scripted_judge({
+            "0": {"is_atomic": False, "subtasks": [
+                {"id": "1", "description": "prepare data"},
+                {"id": "2", "description": "train", "dependencies": ["1"]},
+            ]},
+            "1": {"is_atomic": False, "subtasks": [
+                {"id": "1", "description": "download"},
+                {"id": "2", "description": "clean", "dependencies": ["1"]},
+            ]},
+            "2": {"is_atomic": False, "subtasks": [
+                {"id": "1", "description": "fit"},
+            ]},
+        })
+
+        flat, tree = await decompose("idea", judge)
+
+        deps = {t["id"]: t["dependencies"] for t in flat}
+        self.assertEqual(deps, {
+            "1_1": [],
+            "1_2": ["1_1"],
+            "2_1": ["1_1", "1_2"],
+        })
+        self.assertEqual([c["id"] for c in tree["children"]], ["1", "2"])
+        self.assertEqual([c["is_atomic"] for c in tree["children"]], [False, False])
+        self.assertEqual(
+            [g["id"] for c in tree["children"] for g in c["children"]],
+            ["1_1", "1_2", "2_1"],
+        )
+        self.assertTrue(all(g["is_atomic"] for c in tree["children"] for g in c["children"]))
+
+    async def test_progress_is_coalesced_and_ends_with_final_tree(self):
+        judge = _scripted_judge({
+            "0": {"is_atomic": False, "subtasks": [
+                {"id": str(i), "description": f"task {i}"} for i in range(1, 6)
+            ]},
+        })
+        reported = []
+
+        flat, tree = await decompose("idea", judge, on_judge_done=reported.append)
+
+        self.assertEqual(len(flat), 5)
+        self.assertLess(len(reported), 6)  # one judge for the root, five for children
+        self.assertEqual(reported[-1], tree)
+
+    async def test_failing_progress_report_does_not_abort(self):
+        judge = _scripted_judge({
+            "0": {"is_atomic": False, "subtasks": [{"id": "1", "description": "only"}]},
+        })
+
+        def on_judge_done(tree):
+            raise OSError("disk full")
+
+        with self.assertLogs("backend.pipeline.decompose", level="WARNING"):
+            flat, tree = await decompose("idea", judge, on_judge_done=on_judge_done)
+
+        self.assertEqual([t["id"] for t in flat], ["1"])
+        self.assertEqual(tree["children"][0]["id"], "1")
+
+    async def test_max_depth_stops_further_judging(self):
+        calls = []
+        judge = _scripted_judge(lambda task_id: {"is_atomic": False, "subtasks": [
+            {"id": "1", "description": f"child of {task_id}"},
+        ]}, calls)
+
+        flat, _ = await decompose("idea", judge, max_depth=2, root_id="r1")
+
+        self.assertEqual(calls, ["Judge r1", "Judge r1_1"])
+        self.assertEqual([t["id"] for t in flat], ["r1_1_1"])
+
+
+class InheritedDependenciesTests(unittest.TestCase):
+    def test_collects_ancestor_dependencies_and_memoizes_per_node(self):
+        tasks = _task_map(
+            ("0", None, [], False),
+            ("1", "0", [], True),
+            ("2", "0", ["1"], False),
+            ("2_1", "2", [], True),
+            ("2_2", "2", ["2_1"], True),
+        )
+        memo = {}
+
+        self.assertEqual(_inherited_dependencies(tasks, "2_2", memo), {"1", "2_1"})
+        self.assertEqual(_inherited_dependencies(tasks, "2_1", memo), {"1"})
+        self.assertIs(memo["2_1"], memo["2"])
+
+
+class AtomicDescendantsTests(unittest.TestCase):
+    def test_expands_nested_subtrees_and_memoizes_each_node(self):
+        tasks = _task_map(
+            ("1", None, [], False),
+            ("1_1", "1", [], True),
+            ("1_2", "1", [], False),
+            ("1_2_1", "1_2", [], True),
+        )
+        atomic = {tid: t for tid, t in tasks.items() if t.is_atomic}
+        memo = {}
+
+        self.assertEqual(_atomic_descendants(tasks, "1", atomic, memo), {"1_1", "1_2_1"})
+        self.assertEqual(memo["1_2"], {"1_2_1"})
+        self.assertIs(_atomic_descendants(tasks, "1", atomic, memo), memo["1"])
+
+    def test_child_cycle_terminates(self):
+        tasks = _task_map(
+            ("a", None, [], False),
+            ("b", "a", [], False),
+            ("c", "b", [], True),
+        )
+        tasks["b"].children.insert(0, "a")  # b → a closes a loop
+        atomic = {"c": tasks["c"]}
+
+        self.assertEqual(_atomic_descendants(tasks, "a", atomic, {}), {"c"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import unittest
+
+from backend.pipeline.orchestrator import PipelineOrchestrator
+from backend.routes.events import _collect_batch, _drain_batch
+
+
+def _parse_frames(text: str) -> list[dict]:
+    return [
+        json.loads(block[len("data: "):])
+        for block in text.split("\n\n")
+        if block.startswith("data: ")
+    ]
+
+
+class DrainBatchTests(unittest.TestCase):
+    def test_coalesces_queued_events_in_order(self):
+        orch = PipelineOrchestrator()
+        queue = orch.subscribe()
+        for i in range(4):
+            orch._broadcast({"stage": "research", "chunk": {"text": str(i)}})
+
+        text = _drain_batch(queue.get_nowait(), queue)
+
+        self.assertEqual(
+            [e["chunk"]["text"] for e in _parse_frames(text)],
+            ["0", "1", "2", "3"],
+        )
+        self.assertTrue(queue.empty())
+
+    def test_stops_at_byte_limit(self):
+        orch = PipelineOrchestrator()
+        queue = orch.subscribe()
+        for _ in range(4):
+            orch._broadcast({"stage": "write", "chunk": {"text": "x" * 100}})
+
+        text = _drain_batch(queue.get_nowait(), queue, limit=150)
+
+        self.assertEqual(len(_parse_frames(text)), 2)
+        self.assertEqual(queue.qsize(), 2)
+
+    def test_collect_waits_briefly_for_trailing_frames_of_a_burst(self):
+        async def run():
+            orch = PipelineOrchestrator()
+            queue = orch.subscribe()
+            orch._broadcast({"stage": "research", "chunk": {"text": "a"}})
+            orch._broadcast({"stage": "research", "chunk": {"text": "b"}})
+            asyncio.get_running_loop().call_later(
+                0.005, orch._broadcast, {"stage": "research", "chunk": {"text": "c"}},
+            )
+            return await _collect_batch(queue.get_nowait(), queue, window=0.05)
+
+        text = asyncio.run(run())
+
+        self.assertEqual([e["chunk"]["text"] for e in _parse_frames(text)], ["a", "b", "c"])
+
+    def test_collect_sends_a_lone_frame_without_waiting(self):
+        async def run():
+            orch = PipelineOrchestrator()
+            queue = orch.subscribe()
+            orch._broadcast({"stage": "refine"})
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            text = await _collect_batch(queue.get_nowait(), queue, window=1.0)
+            return text, loop.time() - started
+
+        text, elapsed = asyncio.run(run())
+
+        self.assertEqual(_parse_frames(text), [{"stage": "refine"}])
+        self.assertLess(elapsed, 0.5)
+
+
+class BroadcastTests(unittest.TestCase):
+    def test_subscribers_share_one_serialized_frame(self):
+        orch = PipelineOrchestrator()
+        first, second = orch.subscribe(), orch.subscribe()
+
+        orch._broadcast({"stage": "refine", "phase": "critique"})
+
+        frame = first.get_nowait()
+        self.assertIs(second.get_nowait(), frame)
+        self.assertEqual(_parse_frames(frame), [{"stage": "refine", "phase": "critique"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
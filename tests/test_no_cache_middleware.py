@@ -0,0 +1,22 @@
+import unittest
+
+from asgi_harness import run_middleware
+from backend.main import NoCacheStaticMiddleware
+
+
+def _run(path):
+    return run_middleware(NoCacheStaticMiddleware, path, [(b"cache-control", b"max-age=60")])
+
+
+class NoCacheStaticMiddlewareTests(unittest.TestCase):
+    def test_static_assets_get_no_cache_header(self):
+        headers = _run("/js/app.js")
+        self.assertEqual(headers[b"cache-control"], b"no-cache, no-store, must-revalidate")
+
+    def test_api_responses_pass_through(self):
+        headers = _run("/api/session/meta")
+        self.assertEqual(headers[b"cache-control"], b"max-age=60")
+
+
+if __name__ == "__main__":
+    unittest.main()
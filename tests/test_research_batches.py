@@ -1,8 +1,10 @@
+import asyncio
 import tempfile
 import unittest
+from unittest.mock import patch
 
 from backend.db import ResearchDB
-from backend.pipeline.research import ResearchStage
+from backend.pipeline.research import ResearchStage, topological_batches
 
 
 class ResearchBatchTests(unittest.TestCase):
@@ -29,6 +31,87 @@ class ResearchBatchTests(unittest.TestCase):
             self.assertEqual(saved["r2_1"]["batch"], 3)
             self.assertEqual(saved["r2_2"]["batch"], 4)
 
+    def test_update_task_follows_plan_reassignment(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = ResearchDB(base_dir=tmpdir)
+            db.create_session("task index")
+
+            stage = ResearchStage(db=db)
+            stage._all_tasks = [{"id": "1"}, {"id": "2"}]
+            stage._update_task("2", status="completed")
+
+            # Redecompose replaces "1" with subtasks, shifting positions
+            stage._all_tasks = [{"id": "2", "status": "completed"}, {"id": "1_1"}, {"id": "1_2"}]
+            stage._update_task("1_2", status="running")
+
+            saved = {task["id"]: task for task in db.get_plan_list()}
+            self.assertEqual(saved["1_2"]["status"], "running")
+            self.assertEqual(saved["2"]["status"], "completed")
+            self.assertNotIn("status", saved["1_1"])
+
+    def test_run_batch_bounds_workers_and_keeps_order(self):
+        stage = ResearchStage()
+        running = {"now": 0, "peak": 0}
+
+        async def fake_execute(task):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0)
+            running["now"] -= 1
+            if task["id"] == "3":
+                raise RuntimeError("boom")
+            return task["id"]
+
+        stage._execute_task = fake_execute
+        batch = [{"id": str(i)} for i in range(6)]
+        with patch("backend.pipeline.research.settings.api_concurrency", 2):
+            results = asyncio.run(stage._run_batch(batch))
+
+        self.assertEqual(running["peak"], 2)
+        self.assertEqual(results[:3], ["0", "1", "2"])
+        self.assertIsInstance(results[3], RuntimeError)
+        self.assertEqual(results[4:], ["4", "5"])
+
+
+class TopologicalBatchesTests(unittest.TestCase):
+    @staticmethod
+    def _ids(batches):
+        return [sorted(t["id"] for t in batch) for batch in batches]
+
+    def test_batches_follow_dependency_levels(self):
+        tasks = [
+            {"id": "1", "dependencies": []},
+            {"id": "2", "dependencies": ["1"]},
+            {"id": "3", "dependencies": []},
+            {"id": "4", "dependencies": ["2", "3"]},
+        ]
+        self.assertEqual(self._ids(topological_batches(tasks)), [["1", "3"], ["2"], ["4"]])
+
+    def test_precompleted_dependencies_are_satisfied(self):
+        tasks = [{"id": "r2_1", "dependencies": ["1"]}]
+        self.assertEqual(self._ids(topological_batches(tasks, precompleted={"1"})), [["r2_1"]])
+
+    def test_cycle_is_broken_at_back_edge(self):
+        tasks = [
+            {"id": "1", "dependencies": ["2"]},
+            {"id": "2", "dependencies": ["1"]},
+            {"id": "3", "dependencies": []},
+            {"id": "4", "dependencies": ["1"]},
+        ]
+        with self.assertLogs("backend.pipeline.research", level="WARNING"):
+            batches = topological_batches(tasks)
+        self.assertEqual(self._ids(batches), [["3"], ["2"], ["1"], ["4"]])
+
+    def test_unknown_dependency_does_not_block(self):
+        tasks = [
+            {"id": "1", "dependencies": []},
+            {"id": "2", "dependencies": ["1", "missing"]},
+            {"id": "3", "dependencies": ["2"]},
+        ]
+        with self.assertLogs("backend.pipeline.research", level="WARNING"):
+            batches = topological_batches(tasks)
+        self.assertEqual(self._ids(batches), [["1"], ["2"], ["3"]])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+import tempfile
+import unittest
+
+from backend.db import ResearchDB
+
+
+class ResearchDBLogTests(unittest.TestCase):
+    def test_get_log_sees_chunks_queued_for_the_writer(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = ResearchDB(base_dir=tmpdir)
+            db.create_session("log writer")
+            for i in range(50):
+                db.append_log("research", "c1", f"chunk {i}", 2, task_id="1")
+
+            entries, offset = db.get_log()
+
+            self.assertEqual(offset, 50)
+            self.assertEqual([e["text"] for e in entries], [f"chunk {i}" for i in range(50)])
+            self.assertEqual(entries[0]["task_id"], "1")
+
+    def test_clear_stage_outputs_drops_queued_chunks_of_that_stage(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = ResearchDB(base_dir=tmpdir)
+            db.create_session("log writer")
+            db.append_log("refine", "c1", "keep", 2)
+            db.append_log("research", "c2", "drop", 2)
+
+            db.clear_stage_outputs("research")
+            entries, _ = db.get_log()
+
+            self.assertEqual([e["text"] for e in entries], ["keep"])
+
+    def test_switching_sessions_flushes_to_the_old_session(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = ResearchDB(base_dir=tmpdir)
+            first = db.create_session("first")
+            db.append_log("refine", "c1", "first session", 2)
+            db.create_session("second")
+            db.append_log("refine", "c1", "second session", 2)
+
+            second_entries, _ = db.get_log()
+            db.attach_session(first)
+            first_entries, _ = db.get_log()
+
+            self.assertEqual([e["text"] for e in first_entries], ["first session"])
+            self.assertEqual([e["text"] for e in second_entries], ["second session"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,17 @@
+import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from fastapi import HTTPException
 
-from backend.routes.session import _resolve_relative_path
+from backend.db import ResearchDB
+from backend.routes import session as session_routes
+from backend.routes.session import (
+    _cached_body, _json_file_response, _resolve_relative_path, _text_file_response,
+)
 
 
 class SessionRoutesTests(unittest.TestCase):
@@ -20,6 +27,92 @@ class SessionRoutesTests(unittest.TestCase):
             with self.assertRaises(HTTPException):
                 _resolve_relative_path(base, "../outside.txt")
 
+    def test_cached_body_reuses_body_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = ResearchDB(base_dir=tmpdir)
+            db.create_session("cached reads")
+            path = db.plan_list_path()
+
+            self.assertIsNone(_cached_body(path))
+            db.save_plan_list([{"id": "1"}])
+            first = _cached_body(path)
+            self.assertIs(_cached_body(path), first)
+
+            db.save_plan_list([{"id": "1", "status": "completed"}])
+            self.assertEqual(json.loads(_cached_body(path)), [{"id": "1", "status": "completed"}])
+
+    def test_cached_body_renders_documents(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = ResearchDB(base_dir=tmpdir)
+            db.create_session("cached reads")
+            db.save_refined_idea("# Idea")
+            path = db.document_path("refined_idea")
+
+            body = _cached_body(path, lambda raw: raw.upper())
+
+            self.assertEqual(body, b"# IDEA")
+
+    def test_cached_body_evicts_least_recently_used_entry(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            paths = [base / f"doc_{i}.md" for i in range(3)]
+            for path in paths:
+                path.write_text(path.stem, encoding="utf-8")
+            session_routes._body_cache.clear()
+
+            with patch.object(session_routes, "_BODY_CACHE_MAX", 2):
+                _cached_body(paths[0])
+                _cached_body(paths[1])
+                _cached_body(paths[0])  # refresh: paths[1] is now the oldest
+                _cached_body(paths[2])
+
+            self.assertEqual(list(session_routes._body_cache), [paths[0], paths[2]])
+
+    def test_corrupt_json_file_serves_default(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "meta.json"
+            path.write_text('{"tokens_total": 1', encoding="utf-8")
+
+            self.assertEqual(_json_file_response(path, b"{}").body, b"{}")
+
+    def test_text_response_keeps_blank_documents_and_translates_newlines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            (base / "blank.md").write_bytes(b"  \n")
+            (base / "crlf.md").write_bytes(b"a\r\nb\rc")
+            (base / "empty.md").write_bytes(b"")
+
+            blank = _text_file_response(base / "blank.md", "name", "blank")
+            crlf = _text_file_response(base / "crlf.md", "name", "crlf")
+
+            self.assertEqual(json.loads(blank.body)["content"], "  \n")
+            self.assertEqual(json.loads(crlf.body)["content"], "a\nb\nc")
+            self.assertIsNone(_text_file_response(base / "empty.md", "name", "empty"))
+
+    def test_rewritten_document_is_not_served_stale(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = ResearchDB(base_dir=tmpdir)
+            db.create_session("cached reads")
+            path = db.document_path("paper")
+            db.save_paper("draft A")
+            first = _text_file_response(path, "name", "paper").body
+            st = path.stat()
+
+            db.save_paper("draft B")  # same size; force the same mtime
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+            self.assertNotEqual(_text_file_response(path, "name", "paper").body, first)
+
+    def test_task_output_path_matches_saved_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = ResearchDB(base_dir=tmpdir)
+            db.create_session("cached reads")
+            db.save_task_output("r1/2", "output")
+
+            response = _text_file_response(db.task_output_path("r1/2"), "task_id", "r1/2")
+
+            self.assertEqual(json.loads(response.body), {"task_id": "r1/2", "content": "output"})
+
 
 if __name__ == "__main__":
     unittest.main()
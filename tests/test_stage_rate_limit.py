@@ -0,0 +1,32 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from backend.pipeline.stage import Stage
+
+
+class StageRateLimitTests(unittest.TestCase):
+    def test_concurrent_calls_are_spaced_by_the_interval(self):
+        starts = []
+
+        async def call(stage):
+            await stage._rate_limit()
+            starts.append(time.monotonic())
+
+        async def main():
+            stage = Stage(name="refine")
+            await asyncio.gather(*(call(stage) for _ in range(3)))
+
+        with patch("backend.pipeline.stage._RATE_INTERVAL", 0.05), \
+             patch.object(Stage, "_rate_last_ts", 0.0):
+            asyncio.run(main())
+
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        self.assertEqual(len(gaps), 2)
+        for gap in gaps:
+            self.assertGreaterEqual(gap, 0.045)
+
+
+if __name__ == "__main__":
+    unittest.main()
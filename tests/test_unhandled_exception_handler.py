@@ -0,0 +1,33 @@
+import asyncio
+import json
+import unittest
+
+from fastapi.testclient import TestClient
+
+from backend.main import app, unhandled_exception
+
+
+class _FailingOrchestrator:
+    async def start(self, research_input: str):
+        raise RuntimeError("Stage 'x' is running")
+
+
+class UnhandledExceptionHandlerTests(unittest.TestCase):
+    def test_reports_error_as_500_detail(self):
+        resp = asyncio.run(unhandled_exception(None, RuntimeError("Stage 'x' is running")))
+        self.assertEqual(resp.status_code, 500)
+        self.assertEqual(json.loads(resp.body), {"detail": "Stage 'x' is running"})
+
+    def test_route_error_becomes_json_500(self):
+        app.state.orchestrator = _FailingOrchestrator()
+        self.addCleanup(delattr, app.state, "orchestrator")
+        client = TestClient(app, raise_server_exceptions=False)
+
+        resp = client.post("/api/pipeline/start", json={"input": "study something"})
+
+        self.assertEqual(resp.status_code, 500)
+        self.assertEqual(resp.json(), {"detail": "Stage 'x' is running"})
+
+
+if __name__ == "__main__":
+    unittest.main()